@@ -277,24 +277,25 @@ class ApicalTiebreakTemporalMemory(object):
 
     # Learn
     if learn:
-      # Learn on existing segments
-      for learningSegments in (learningActiveBasalSegments,
-                               learningMatchingBasalSegments):
-        self._learn(self.basalConnections, self.rng, learningSegments,
-                    basalReinforceCandidates, basalGrowthCandidates,
-                    self.basalPotentialOverlaps,
-                    self.initialPermanence, self.sampleSize,
-                    self.permanenceIncrement, self.permanenceDecrement,
-                    self.maxSynapsesPerSegment)
-
-      for learningSegments in (learningActiveApicalSegments,
-                               learningMatchingApicalSegments):
-
-        self._learn(self.apicalConnections, self.rng, learningSegments,
-                    apicalReinforceCandidates, apicalGrowthCandidates,
-                    self.apicalPotentialOverlaps, self.initialPermanence,
-                    self.sampleSize, self.permanenceIncrement,
-                    self.permanenceDecrement, self.maxSynapsesPerSegment)
+      # Learn on existing segments. The active and matching learning segments
+      # are on disjoint sets of cells, so each connections object can update
+      # all of them in a single bulk call.
+      self._learn(self.basalConnections, self.rng,
+                  np.concatenate((learningActiveBasalSegments,
+                                  learningMatchingBasalSegments)),
+                  basalReinforceCandidates, basalGrowthCandidates,
+                  self.basalPotentialOverlaps,
+                  self.initialPermanence, self.sampleSize,
+                  self.permanenceIncrement, self.permanenceDecrement,
+                  self.maxSynapsesPerSegment)
+
+      self._learn(self.apicalConnections, self.rng,
+                  np.concatenate((learningActiveApicalSegments,
+                                  learningMatchingApicalSegments)),
+                  apicalReinforceCandidates, apicalGrowthCandidates,
+                  self.apicalPotentialOverlaps, self.initialPermanence,
+                  self.sampleSize, self.permanenceIncrement,
+                  self.permanenceDecrement, self.maxSynapsesPerSegment)
 
       # Punish incorrect predictions
       if self.basalPredictedSegmentDecrement != 0.0:
@@ -19,12 +19,48 @@
 # http://numenta.org/licenses/
 # ----------------------------------------------------------------------
 
-import random
+from __future__ import print_function
+
+import numpy
+
+
+
+def _buildSequences(symbols, order, numPredictions):
+  """
+  Arrange a permutation of symbols into the high order sequences returned by
+  SequenceGenerator.generate, as one (numSequences, order + 1) array.
+  """
+  if order == 0:
+    return symbols[0:2].reshape((2, 1))
+
+  # Each sequence is [start] + subsequence + [prediction]. The first
+  # numPredictions sequences share one start symbol, the rest share another,
+  # and every sequence ends in its own prediction symbol.
+  sequences = numpy.empty((numPredictions * 2, order + 1),
+                          dtype=symbols.dtype)
+  sequences[:numPredictions, 0] = symbols[order-1]
+  sequences[numPredictions:, 0] = symbols[order]
+  sequences[:, 1:order] = symbols[0:order-1]
+  sequences[:, order] = symbols[order+1:]
+
+  if order > 2:
+    # Same starts with the subsequence and the predictions reversed. Each
+    # reversed sequence directly follows its forward counterpart.
+    reversedSequences = sequences.copy()
+    reversedSequences[:, 1:order] = symbols[order-2::-1]
+    reversedSequences[:, order] = symbols[:order:-1]
+    sequences = numpy.concatenate((sequences, reversedSequences),
+                                  axis=1).reshape((-1, order + 1))
+
+  return sequences
 
 
 
 class SequenceGenerator(object):
 
+  # The seed is the generator's only state
+  __slots__ = ("seed",)
+
   def __init__(self, seed=None):
     self.seed = seed
 
@@ -34,55 +70,37 @@ class SequenceGenerator(object):
     return order + 1 + (numPredictions * 2)
 
 
-  def generate(self, order, numPredictions=1):
-    symbols = range(self.numSymbols(order, numPredictions))
-    random.seed(self.seed)
-    random.shuffle(symbols)
-    random.seed()
-
-    if order == 0:
-      return [[symbols[0]], [symbols[1]]]
-
-    subsequence = symbols[0:order-1]
-    sequences = []
-
-    for i in xrange(2):
-      start = order+i-1
-
-      for j in xrange(numPredictions):
-        # TODO: refactor
-        remainder = symbols[-(numPredictions * 2):]
-        predictions = remainder[numPredictions * i:numPredictions * (i + 1)]
-        sequence = [symbols[start]] + subsequence + [predictions[j]]
-        sequences.append(sequence)
+  def generate(self, order, numPredictions=1, seed=None):
+    """
+    If seed is given, it is used instead of the generator's seed for this call.
+    """
+    if seed is None:
+      seed = self.seed
 
-        if order > 2:
-          remainder = list(reversed(remainder))
-          predictions = remainder[numPredictions * i:numPredictions * (i + 1)]
-          sequence = [symbols[start]] + list(reversed(subsequence)) + [predictions[j]]
-          sequences.append(sequence)
+    symbols = numpy.random.RandomState(seed).permutation(
+      self.numSymbols(order, numPredictions))
 
-    return sequences
+    return _buildSequences(symbols, order, numPredictions).tolist()
 
 
 
 if __name__ == "__main__":
   generator = SequenceGenerator(seed=42)
 
-  print "Examples:"
-  print "Order 1, with 5 predictions for each sequence:", generator.generate(1, 5)
-  print "Order 2, with 3 predictions for each sequence:", generator.generate(2, 3)
-  print "Order 3, with 4 predictions for each sequence:", generator.generate(3, 4)
-  print "Order 4, with 2 predictions for each sequence:", generator.generate(4, 2)
-  print "Order 10, with 1 prediction for each sequence:", generator.generate(10, 1)
+  print("Examples:")
+  print("Order 1, with 5 predictions for each sequence:", generator.generate(1, 5))
+  print("Order 2, with 3 predictions for each sequence:", generator.generate(2, 3))
+  print("Order 3, with 4 predictions for each sequence:", generator.generate(3, 4))
+  print("Order 4, with 2 predictions for each sequence:", generator.generate(4, 2))
+  print("Order 10, with 1 prediction for each sequence:", generator.generate(10, 1))
 
-  print
+  print()
 
-  print "Order 6, with 4 predictions for each sequence:", generator.generate(6, 4)
-  print "Order 7, with 4 predictions for each sequence:", generator.generate(7, 4)
+  print("Order 6, with 4 predictions for each sequence:", generator.generate(6, 4))
+  print("Order 7, with 4 predictions for each sequence:", generator.generate(7, 4))
 
-  print
+  print()
 
-  print "Edge cases:"
-  print "Order 0, with 1 prediction for each sequence:", generator.generate(0, 1)
-  print "Order 0, with 5 predictions for each sequence:", generator.generate(0, 5)
+  print("Edge cases:")
+  print("Order 0, with 1 prediction for each sequence:", generator.generate(0, 1))
+  print("Order 0, with 5 predictions for each sequence:", generator.generate(0, 5))
@@ -54,6 +54,7 @@ class L4TMExperiment(L4L2Experiment):
                logCalls=False,
                objectNamesAreIndices=False,
                TMOverrides=None,
+               enableProfiling=False,
                ):
     """
     Creates the network.
@@ -62,6 +63,10 @@ class L4TMExperiment(L4L2Experiment):
     ----------------------------
     @param   TMOverrides (dict)
              Parameters to override in the TM region
+
+    @param   enableProfiling (bool)
+             If True, region compute timers are enabled so that printProfile
+             reports timings
     """
 
     # Handle logging - this has to be done first
@@ -90,6 +95,7 @@ class L4TMExperiment(L4L2Experiment):
       "L4Params": self.getDefaultL4Params(inputSize, numExternalInputBits),
       "L2Params": self.getDefaultL2Params(inputSize, numInputBits),
       "TMParams": self.getDefaultTMParams(self.inputSize, self.numInputBits),
+      "enableProfiling": enableProfiling,
     }
 
 
@@ -47,12 +47,69 @@ such as "externalInput_0", "L2Column_3", etc. The reset signal (from
 sensorInput) is sent to all the other regions.
 
 """
-import copy
 import json
-import numpy
 
 from htmresearch.frameworks.layers.l2_l4_network_creation import enableProfiling
 
+
+# Phases of the regions in a column, before the column suffix is appended.
+# The externalInput sensor, when present, also runs in phase 0.
+# L4 and L2 regions always have phases 2 and 3, respectively
+# TM region has same phase as L4 since they do not interconnect
+_PHASES = (
+  ("sensorInput", [0]),
+  ("L4Column", [2]),
+  ("TMColumn", [2]),
+  ("L2Column", [3]),
+)
+
+# Links within a column, as (source, destination, srcOutput, destInput,
+# propagationDelay), before the column suffix is appended to region names.
+_LINKS = (
+  # Link sensors to L4
+  ("externalInput", "L4Column", "dataOut", "basalInput", 0),
+  ("externalInput", "L4Column", "dataOut", "basalGrowthCandidates", 0),
+  ("sensorInput", "L4Column", "dataOut", "activeColumns", 0),
+
+  # Link main inputs to TM
+  ("sensorInput", "TMColumn", "dataOut", "activeColumns", 0),
+
+  # Link L4 to L2. A single link carries both the active cells (feedforward
+  # input) and the predicted active cells (feedforward growth candidates).
+  ("L4Column", "L2Column", "activeAndPredictedActiveCells",
+   "feedforwardInputAndGrowthCandidates", 0),
+
+  # Link L2 feedback to L4
+  ("L2Column", "L4Column", "feedForwardOutput", "apicalInput", 1),
+
+  # Link reset output to L2, TM, and L4
+  ("sensorInput", "L2Column", "resetOut", "resetIn", 0),
+  ("sensorInput", "TMColumn", "resetOut", "resetIn", 0),
+  ("sensorInput", "L4Column", "resetOut", "resetIn", 0),
+)
+
+# Region parameter strings, keyed by the frozen contents of the params dict.
+_paramsJsonCache = {}
+
+
+def _dumps(params):
+  """
+  Return json.dumps(params), reusing the string from an earlier call with the
+  same parameters. Columns built from one networkConfig share their region
+  parameters, so each of them is only serialized once. Dicts with unhashable
+  values (e.g. lists) are serialized without caching.
+  """
+  try:
+    # Include the type so that e.g. True and 1 don't map to the same string
+    key = frozenset((k, type(v), v) for k, v in params.items())
+  except TypeError:
+    return json.dumps(params)
+
+  if key not in _paramsJsonCache:
+    _paramsJsonCache[key] = json.dumps(params)
+  return _paramsJsonCache[key]
+
+
 def createL4L2TMColumn(network, networkConfig, suffix=""):
   """
   Create a a single column containing one L4, one L2, and one TM.
@@ -76,79 +133,97 @@ def createL4L2TMColumn(network, networkConfig, suffix=""):
 
   Region names are externalInput, sensorInput, L4Column, L2Column, and TMColumn.
   Each name has an optional string suffix appended to it.
+
+  The temporal memory used by TMColumn and L4Column is chosen with the
+  "implementation" key of TMParams and L4Params. "ApicalTiebreakCPP" (the
+  TMColumn default) runs entirely in C++. "ApicalTiebreak" (the L4Column
+  default) and "ApicalDependent" are numpy implementations that compute segment
+  activity and cell states with bulk SparseMatrixConnections and numpy
+  operations, with no per-cell Python loops.
+
+  To drive the network for many timesteps, it is cheapest to queue all inputs
+  up front with the sensors' addBatchToQueue(denseData, ...) and then call
+  network.run(numRecords) once, instead of queuing one record and calling
+  network.run(1) per timestep.
+
+  Profiling is off by default, so regions don't pay for compute timers. Two
+  optional networkConfig keys control it:
+
+    "enableProfiling": True turns on profiling for the column's regions.
+    "profileRegions": ["L4Column", ...] limits profiling to the named regions
+                      (names without the suffix). The default is all regions
+                      in the network.
   """
+  return createL4L2TMColumnBuilder(networkConfig)(network, suffix)
 
-  externalInputName = "externalInput" + suffix
-  sensorInputName = "sensorInput" + suffix
-  L4ColumnName = "L4Column" + suffix
-  L2ColumnName = "L2Column" + suffix
-  TMColumnName = "TMColumn" + suffix
 
-  L4Params = copy.deepcopy(networkConfig["L4Params"])
+def createL4L2TMColumnBuilder(networkConfig):
+  """
+  Return a function buildColumn(network, suffix="") that adds one column to
+  the network, exactly like createL4L2TMColumn(network, networkConfig, suffix),
+  and returns the network.
+
+  Everything that only depends on networkConfig (region parameter copies and
+  their JSON strings, the phase schedule, profiling choices) is computed once
+  here. Building many columns from the same networkConfig then only costs the
+  network API calls. networkConfig is read when the builder is created; later
+  changes to it don't affect the builder.
+  """
+  # Only top-level keys are overwritten, so a shallow copy is enough
+  L4Params = dict(networkConfig["L4Params"])
   L4Params["basalInputWidth"] = networkConfig["externalInputSize"]
   L4Params["apicalInputWidth"] = networkConfig["L2Params"]["cellCount"]
 
-  if networkConfig["externalInputSize"] > 0:
-      network.addRegion(
-        externalInputName, "py.RawSensor",
-        json.dumps({"outputWidth": networkConfig["externalInputSize"]}))
-  network.addRegion(
-    sensorInputName, "py.RawSensor",
-    json.dumps({"outputWidth": networkConfig["sensorInputSize"]}))
-
-  network.addRegion(L4ColumnName, "py.ApicalTMPairRegion", json.dumps(L4Params))
-  network.addRegion(TMColumnName,
-                    "py.ApicalTMSequenceRegion",
-                    json.dumps(networkConfig["TMParams"]))
-  network.addRegion(L2ColumnName,
-                    "py.ColumnPoolerRegion",
-                    json.dumps(networkConfig["L2Params"]))
+  # Regions to add, as (name, type, JSON params), in creation order
+  regions = []
 
   # Set phases appropriately so regions are executed in the proper sequence
   # This is required for multiple columns - the order of execution is not the
   # same as the order of region creation.
-  if networkConfig["externalInputSize"] > 0:
-      network.setPhases(externalInputName,[0])
-  network.setPhases(sensorInputName,[0])
+  phases = list(_PHASES)
 
-  # L4 and L2 regions always have phases 2 and 3, respectively
-  # TM region has same phase as L4 since they do not interconnect
-  network.setPhases(L4ColumnName,[2])
-  network.setPhases(TMColumnName,[2])
-  network.setPhases(L2ColumnName,[3])
-
-  # Link sensors to L4
-  network.link(externalInputName, L4ColumnName, "UniformLink", "",
-               srcOutput="dataOut", destInput="basalInput")
-  network.link(externalInputName, L4ColumnName, "UniformLink", "",
-               srcOutput="dataOut", destInput="basalGrowthCandidates")
-  network.link(sensorInputName, L4ColumnName, "UniformLink", "",
-               srcOutput="dataOut", destInput="activeColumns")
-
-  # Link main inputs to TM
-  network.link(sensorInputName, TMColumnName, "UniformLink", "",
-               srcOutput="dataOut", destInput="activeColumns")
-
-  # Link L4 to L2
-  network.link(L4ColumnName, L2ColumnName, "UniformLink", "",
-               srcOutput="activeCells", destInput="feedforwardInput")
-  network.link(L4ColumnName, L2ColumnName, "UniformLink", "",
-               srcOutput="predictedActiveCells",
-               destInput="feedforwardGrowthCandidates")
-
-  # Link L2 feedback to L4
-  network.link(L2ColumnName, L4ColumnName, "UniformLink", "",
-               srcOutput="feedForwardOutput", destInput="apicalInput",
-               propagationDelay=1)
-
-  # Link reset output to L2, TM, and L4
-  network.link(sensorInputName, L2ColumnName, "UniformLink", "",
-               srcOutput="resetOut", destInput="resetIn")
-  network.link(sensorInputName, TMColumnName, "UniformLink", "",
-               srcOutput="resetOut", destInput="resetIn")
-  network.link(sensorInputName, L4ColumnName, "UniformLink", "",
-               srcOutput="resetOut", destInput="resetIn")
-
-  enableProfiling(network)
-
-  return network
+  if networkConfig["externalInputSize"] > 0:
+    regions.append(
+      ("externalInput", "py.RawSensor",
+       _dumps({"outputWidth": networkConfig["externalInputSize"]})))
+    phases.insert(0, ("externalInput", [0]))
+
+  regions.extend([
+    ("sensorInput", "py.RawSensor",
+     _dumps({"outputWidth": networkConfig["sensorInputSize"]})),
+    ("L4Column", "py.ApicalTMPairRegion", _dumps(L4Params)),
+    ("TMColumn", "py.ApicalTMSequenceRegion",
+     _dumps(networkConfig["TMParams"])),
+    ("L2Column", "py.ColumnPoolerRegion", _dumps(networkConfig["L2Params"])),
+  ])
+
+  profile = networkConfig.get("enableProfiling", False)
+  profileRegions = networkConfig.get("profileRegions")
+  if profileRegions is not None:
+    profileRegions = tuple(profileRegions)
+
+  def buildColumn(network, suffix=""):
+    addRegion = network.addRegion
+    for regionName, regionType, regionParams in regions:
+      addRegion(regionName + suffix, regionType, regionParams)
+
+    setPhases = network.setPhases
+    for regionName, regionPhases in phases:
+      setPhases(regionName + suffix, regionPhases)
+
+    link = network.link
+    for srcName, destName, srcOutput, destInput, propagationDelay in _LINKS:
+      link(srcName + suffix, destName + suffix, "UniformLink", "",
+           srcOutput=srcOutput, destInput=destInput,
+           propagationDelay=propagationDelay)
+
+    if profile:
+      if profileRegions is not None:
+        for regionName in profileRegions:
+          network.regions[regionName + suffix].enableProfiling()
+      else:
+        enableProfiling(network)
+
+    return network
+
+  return buildColumn
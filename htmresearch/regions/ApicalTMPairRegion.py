@@ -146,6 +146,18 @@ class ApicalTMPairRegion(PyRegion):
           "regionLevel": True,
           "isDefaultOutput": False
         },
+
+        "activeAndPredictedActiveCells": {
+          "description": ("activeCells and predictedActiveCells packed into "
+                          "one output. Contains a 2 for every cell that "
+                          "transitioned from predicted to active, a 1 for "
+                          "every other active cell, and 0 elsewhere. Lets a "
+                          "single link carry both SDRs."),
+          "dataType": "Real32",
+          "count": 0,
+          "regionLevel": True,
+          "isDefaultOutput": False
+        },
       },
 
       "parameters": {
@@ -433,6 +445,7 @@ class ApicalTMPairRegion(PyRegion):
         outputs["activeCells"][:] = 0
         outputs["predictedActiveCells"][:] = 0
         outputs["winnerCells"][:] = 0
+        outputs["activeAndPredictedActiveCells"][:] = 0
         return
 
     activeColumns = inputs["activeColumns"].nonzero()[0]
@@ -466,11 +479,16 @@ class ApicalTMPairRegion(PyRegion):
     outputs["predictedCells"][:] = 0
     outputs["predictedCells"][
       self._tm.getPredictedCells()] = 1
-    outputs["predictedActiveCells"][:] = (outputs["activeCells"] *
-                                          outputs["predictedCells"])
+    np.multiply(outputs["activeCells"], outputs["predictedCells"],
+                out=outputs["predictedActiveCells"])
     outputs["winnerCells"][:] = 0
     outputs["winnerCells"][self._tm.getWinnerCells()] = 1
 
+    # Predicted active cells are a subset of the active cells, so the sum is
+    # 2 for predicted active cells and 1 for the other active cells.
+    np.add(outputs["activeCells"], outputs["predictedActiveCells"],
+           out=outputs["activeAndPredictedActiveCells"])
+
 
   def getParameter(self, parameterName, index=-1):
     """
@@ -498,7 +516,7 @@ class ApicalTMPairRegion(PyRegion):
     Return the number of elements for the given output.
     """
     if name in ["activeCells", "predictedCells", "predictedActiveCells",
-                "winnerCells"]:
+                "winnerCells", "activeAndPredictedActiveCells"]:
       return self.cellsPerColumn * self.columnCount
     else:
       raise Exception("Invalid output name specified: %s" % name)
@@ -58,10 +58,11 @@ class ColumnPoolerRegion(PyRegion):
       inputs=dict(
         feedforwardInput=dict(
           description="The primary feed-forward input to the layer, this is a"
-                      " binary array containing 0's and 1's",
+                      " binary array containing 0's and 1's. Required unless"
+                      " feedforwardInputAndGrowthCandidates is linked.",
           dataType="Real32",
           count=0,
-          required=True,
+          required=False,
           regionLevel=True,
           isDefaultInput=True,
           requireSplitterMap=False),
@@ -78,6 +79,21 @@ class ColumnPoolerRegion(PyRegion):
           isDefaultInput=False,
           requireSplitterMap=False),
 
+        feedforwardInputAndGrowthCandidates=dict(
+          description=("feedforwardInput and feedforwardGrowthCandidates " +
+                       "packed into one array, e.g. the " +
+                       "activeAndPredictedActiveCells output of " +
+                       "ApicalTMPairRegion. Every nonzero element is " +
+                       "feedforward input, and elements >= 2 are also " +
+                       "growth candidates. If this input is linked, it " +
+                       "replaces the two separate inputs."),
+          dataType="Real32",
+          count=0,
+          required=False,
+          regionLevel=True,
+          isDefaultInput=False,
+          requireSplitterMap=False),
+
         predictedInput=dict(
           description=("An array of 0s and 1s representing input cells that " +
                        "are predicted to become active in the next time step. " +
@@ -447,14 +463,21 @@ class ColumnPoolerRegion(PyRegion):
         outputs["activeCells"][:] = 0
         return
 
-    feedforwardInput = numpy.asarray(inputs["feedforwardInput"].nonzero()[0],
-                                     dtype="uint32")
-
-    if "feedforwardGrowthCandidates" in inputs:
+    if len(inputs.get("feedforwardInputAndGrowthCandidates", ())) > 0:
+      packedInput = inputs["feedforwardInputAndGrowthCandidates"]
+      feedforwardInput = numpy.asarray(packedInput.nonzero()[0],
+                                       dtype="uint32")
       feedforwardGrowthCandidates = numpy.asarray(
-        inputs["feedforwardGrowthCandidates"].nonzero()[0], dtype="uint32")
+        numpy.flatnonzero(packedInput >= 2), dtype="uint32")
     else:
-      feedforwardGrowthCandidates = feedforwardInput
+      feedforwardInput = numpy.asarray(
+        inputs["feedforwardInput"].nonzero()[0], dtype="uint32")
+
+      if "feedforwardGrowthCandidates" in inputs:
+        feedforwardGrowthCandidates = numpy.asarray(
+          inputs["feedforwardGrowthCandidates"].nonzero()[0], dtype="uint32")
+      else:
+        feedforwardGrowthCandidates = feedforwardInput
 
     if "lateralInput" in inputs:
       lateralInputs = tuple(numpy.asarray(singleInput.nonzero()[0],
@@ -20,6 +20,9 @@
 # ----------------------------------------------------------------------
 
 from collections import deque
+
+import numpy as np
+
 from nupic.bindings.regions.PyRegion import PyRegion
 
 
@@ -33,6 +36,11 @@ class RawSensor(PyRegion):
 
   Each data record consists of the non-zero indices of the sparse vector,
   a 0/1 reset flag, and an integer sequence ID.
+
+  Many timesteps can also be queued at once with addBatchToQueue(), passing a
+  dense (numRecords, outputWidth) array. Each call to compute then copies the
+  next row directly into dataOut, which avoids building one record per
+  timestep in Python.
   """
 
   def __init__(self,
@@ -106,18 +114,30 @@ class RawSensor(PyRegion):
     Get the next record from the queue and encode it. The fields for inputs and
     outputs are as defined in the spec above.
     """
-    if len(self.queue) > 0:
-      # Take the top element of the data queue
-      data = self.queue.pop()
+    if len(self.queue) == 0:
+      raise Exception("RawSensor: No data to encode: queue is empty ")
+
+    if "denseData" in self.queue[-1]:
+      # Take the next row of the batch at the top of the data queue
+      batch = self.queue[-1]
+      i = batch["nextRow"]
+      outputs["resetOut"][0] = batch["resets"][i]
+      outputs["sequenceIdOut"][0] = batch["sequenceIds"][i]
+      np.copyto(outputs["dataOut"], batch["denseData"][i])
+
+      batch["nextRow"] += 1
+      if batch["nextRow"] == len(batch["denseData"]):
+        self.queue.pop()
 
     else:
-      raise Exception("RawSensor: No data to encode: queue is empty ")
+      # Take the top element of the data queue
+      data = self.queue.pop()
 
-    # Copy data into output vectors
-    outputs["resetOut"][0] = data["reset"]
-    outputs["sequenceIdOut"][0] = data["sequenceId"]
-    outputs["dataOut"][:] = 0
-    outputs["dataOut"][data["nonZeros"]] = 1
+      # Copy data into output vectors
+      outputs["resetOut"][0] = data["reset"]
+      outputs["sequenceIdOut"][0] = data["sequenceId"]
+      outputs["dataOut"][:] = 0
+      outputs["dataOut"][data["nonZeros"]] = 1
 
     if self.verbosity > 1:
       print "RawSensor outputs:"
@@ -154,6 +174,45 @@ class RawSensor(PyRegion):
     })
 
 
+  def addBatchToQueue(self, denseData, resets=None, sequenceIds=None):
+    """
+    Add a batch of dense records to the sensor's internal queue. The batch is
+    queued behind any items that are already queued, and each call to compute
+    outputs its next row, in order.
+
+    @param denseData   A (numRecords, outputWidth) array of 0's and 1's. Row i
+                       is copied into dataOut on the i-th compute of the batch.
+    @param resets      Optional sequence of numRecords 0/1 reset flags.
+                       Defaults to all 0.
+    @param sequenceIds Optional sequence of numRecords integer sequence IDs.
+                       Defaults to all 0.
+    """
+    denseData = np.ascontiguousarray(denseData, dtype="uint8")
+    numRecords = len(denseData)
+
+    if denseData.ndim != 2 or denseData.shape[1] != self.outputWidth:
+      raise Exception("RawSensor.addBatchToQueue: denseData must have shape "
+                      "(numRecords, {})".format(self.outputWidth))
+    if numRecords == 0:
+      return
+
+    if resets is None:
+      resets = np.zeros(numRecords, dtype="int")
+    if sequenceIds is None:
+      sequenceIds = np.zeros(numRecords, dtype="int")
+
+    if len(resets) != numRecords or len(sequenceIds) != numRecords:
+      raise Exception("RawSensor.addBatchToQueue: resets and sequenceIds must "
+                      "have one entry per record")
+
+    self.queue.appendleft({
+      "denseData": denseData,
+      "resets": np.asarray(resets, dtype="int"),
+      "sequenceIds": np.asarray(sequenceIds, dtype="int"),
+      "nextRow": 0,
+    })
+
+
   def addResetToQueue(self, sequenceId):
     """
     Add a reset signal to the sensor's internal queue. Calls to compute
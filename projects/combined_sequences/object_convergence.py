@@ -233,6 +233,7 @@ def runExperiment(args):
     externalInputSize=1024,
     numExternalInputBits=numInputBits,
     seed=trialNum,
+    enableProfiling=profile,
     L4Overrides={"initialPermanence": 0.41,
                  "activationThreshold": 18,
                  "minThreshold": 18,
@@ -82,6 +82,14 @@ class SwarmRunner():
   @staticmethod
   def importSwarmDescription(dataSet):
     swarmConfigFileName = 'SWARM_CONFIG_' + dataSet
+
+    # Descriptions stored as JSON load without compiling a Python module
+    jsonPath = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'swarm_description', swarmConfigFileName + '.json')
+    if os.path.isfile(jsonPath):
+      with open(jsonPath) as jsonFile:
+        return json.load(jsonFile)
+
     try:
       SWARM_CONFIG = importlib.import_module("swarm_description.%s" % swarmConfigFileName).SWARM_CONFIG
     except ImportError:
@@ -22,8 +22,13 @@
 import unittest
 import random
 
+from nupic.engine import Network
+
 from htmresearch.support.register_regions import registerAllResearchRegions
 from htmresearch.frameworks.layers.laminar_network import createNetwork
+from htmresearch.frameworks.layers.combined_sequence_network_creation import (
+  createL4L2TMColumnBuilder
+)
 
 
 networkConfig1 = {
@@ -135,8 +140,8 @@ class CombinedSequenceNetworkTest(unittest.TestCase):
       "sensorInput_0.dataOut-->TMColumn_0.activeColumns",
       "L2Column_0.feedForwardOutput-->L4Column_0.apicalInput",
       "externalInput_0.dataOut-->L4Column_0.basalInput",
-      "L4Column_0.predictedActiveCells-->L2Column_0.feedforwardGrowthCandidates",
-      "L4Column_0.activeCells-->L2Column_0.feedforwardInput",
+      ("L4Column_0.activeAndPredictedActiveCells-->"
+       "L2Column_0.feedforwardInputAndGrowthCandidates"),
       "sensorInput_0.resetOut-->L2Column_0.resetIn",
       "sensorInput_0.resetOut-->L4Column_0.resetIn",
       "sensorInput_0.resetOut-->TMColumn_0.resetIn",
@@ -161,6 +166,37 @@ class CombinedSequenceNetworkTest(unittest.TestCase):
     self.assertSetEqual(desired_links, links, error_message)
 
 
+  def testColumnBuilder(self):
+    """
+    A column builder can add several identical columns to one network, each
+    wired only to its own regions.
+    """
+    buildColumn = createL4L2TMColumnBuilder(networkConfig1)
+
+    net = Network()
+    buildColumn(net, "_0")
+    buildColumn(net, "_1")
+
+    self.assertEqual(len(net.regions.keys()), 10,
+                     "Incorrect number of regions")
+
+    links = set([link.second.getMoniker() for link in net.getLinks()])
+    self.assertEqual(len(links), 18)
+    for suffix in ("_0", "_1"):
+      self.assertIn("L2Column{0}.feedForwardOutput-->L4Column{0}.apicalInput"
+                    .format(suffix), links)
+      self.assertIn("sensorInput{0}.dataOut-->TMColumn{0}.activeColumns"
+                    .format(suffix), links)
+
+    # Both columns should run
+    for suffix in ("_0", "_1"):
+      net.regions["externalInput" + suffix].getSelf().addDataToQueue(
+        [2, 42, 1023], 0, 0)
+      net.regions["sensorInput" + suffix].getSelf().addDataToQueue(
+        [2, 42, 1023], 0, 0)
+    net.run(1)
+
+
   def testDataFlowL2L4(self):
     """
     This test trains a network with a few (feature, location) pairs and checks
@@ -25,6 +25,8 @@ import shutil
 import tempfile
 import unittest
 
+import numpy
+
 from nupic.engine import Network
 from htmresearch.support.register_regions import registerAllResearchRegions
 
@@ -105,6 +107,42 @@ class RawSensorTest(unittest.TestCase):
                       "Value of sequenceIdOut incorrect")
 
 
+  def testBatch(self):
+    """Dense batches are output row by row, in order with other records."""
+
+    rawParams = {"outputWidth": 1029}
+    net = Network()
+    rawSensor = net.addRegion("raw","py.RawSensor", json.dumps(rawParams))
+    rawSensorPy = rawSensor.getSelf()
+
+    batch = numpy.zeros((2, 1029), dtype="uint8")
+    batch[0, [1, 3, 5]] = 1
+    batch[1, [7, 1028]] = 1
+
+    rawSensorPy.addDataToQueue([2, 4, 6], 0, 42)
+    rawSensorPy.addBatchToQueue(batch, resets=[0, 1], sequenceIds=[50, 51])
+    rawSensorPy.addDataToQueue([18, 19, 20], 0, 44)
+
+    expected = [
+      ([2, 4, 6], 0, 42),
+      ([1, 3, 5], 0, 50),
+      ([7, 1028], 1, 51),
+      ([18, 19, 20], 0, 44),
+    ]
+
+    for nonZeros, reset, sequenceId in expected:
+      net.run(1)
+      self.assertEqual(
+        list(rawSensor.getOutputData("dataOut").nonzero()[0]), nonZeros,
+        "Value of dataOut incorrect")
+      self.assertEqual(rawSensor.getOutputData("resetOut").sum(), reset,
+                       "Value of resetOut incorrect")
+      self.assertEqual(rawSensor.getOutputData("sequenceIdOut").sum(),
+                       sequenceId, "Value of sequenceIdOut incorrect")
+
+    self.assertEqual(len(rawSensorPy.queue), 0, "Queue should be empty")
+
+
 if __name__ == "__main__":
   unittest.main()
 